@@ -49,17 +49,17 @@ class FormatEvents(BaseFrontendScriptNote):
 
 
 class System(BaseSystemNote):
-    workspace_templates = [
+    workspace_templates = (
         Event,
         Birthday,
         Meeting,
         Battle,
-    ]
-    scripts = [
+    )
+    scripts = (
         GetEventsByPerson,
         GetEventsByPlace,
         FormatEvents,
-    ]
+    )
 
 
 @label("iconClass", "bx bx-calendar")
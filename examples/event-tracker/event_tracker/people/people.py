@@ -35,13 +35,11 @@ class Group(BaseWorkspaceTemplateNote):
 
 
 class System(BaseSystemNote):
-    workspace_templates = [
+    workspace_templates = (
         Person,
         Group,
-    ]
-    widgets = [
-        RelatedEventsWidget,
-    ]
+    )
+    widgets = (RelatedEventsWidget,)
 
 
 @label("iconClass", "bx bxs-group")
@@ -76,20 +76,18 @@ class ResidentsWidget(BaseWidgetNote):
 
 
 class System(BaseSystemNote):
-    workspace_templates = [
+    workspace_templates = (
         Residence,
         Business,
         PointOfInterest,
         City,
         Land,
-    ]
-    scripts = [
-        CreateRelation,
-    ]
-    widgets = [
+    )
+    scripts = (CreateRelation,)
+    widgets = (
         RelatedEventsWidget,
         ResidentsWidget,
-    ]
+    )
 
 
 @label("iconClass", "bx bxs-map-alt")
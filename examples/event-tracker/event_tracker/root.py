@@ -15,7 +15,7 @@ class System(BaseRootSystemNote):
     Root `System` note.
     """
 
-    themes = [VSCodeDark]
+    themes = (VSCodeDark,)
 
 
 @label("eventTrackerRoot")  # define on a note manually for installation
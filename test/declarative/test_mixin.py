@@ -1,5 +1,7 @@
 from typing import cast
 
+from pytest import raises
+
 from trilium_alchemy import *
 
 
@@ -57,3 +59,63 @@ def test_mixin(session: Session):
 
     assert labelm3.name == "labelm3"
     assert labelm3.value == ""
+
+
+@labels("label1", ("label2", "value2"))
+@label("label3")
+class LabelsTestNote(BaseDeclarativeNote):
+    pass
+
+
+def test_labels(session: Session):
+    note = LabelsTestNote(session=session)
+
+    assert len(note.attributes.owned) == 3
+    label1, label2, label3 = cast(list[Label], note.attributes.owned)
+
+    assert label1.name == "label1"
+    assert label1.value == ""
+
+    assert label2.name == "label2"
+    assert label2.value == "value2"
+
+    assert label3.name == "label3"
+    assert label3.value == ""
+
+
+class ChildClsGrandchild(BaseDeclarativeNote):
+    pass
+
+
+class ChildClsCategory(BaseDeclarativeNote):
+    pass
+
+
+class ChildClsParent(BaseDeclarativeNote):
+    def init(self, _: list[BaseAttribute], children: list[Branch]):
+        # pass class rather than instance
+        children.append(
+            self.create_declarative_child(
+                ChildClsCategory, children=[ChildClsGrandchild]
+            )
+        )
+
+
+def test_create_declarative_child_cls(session: Session):
+    note = ChildClsParent(session=session)
+
+    assert len(note.children) == 1
+    category = note.children[0]
+    assert isinstance(category, ChildClsCategory)
+
+    # class was instantiated in the parent's session
+    assert len(category.children) == 1
+    grandchild = category.children[0]
+    assert isinstance(grandchild, ChildClsGrandchild)
+    assert grandchild.session is session
+
+
+def test_labels_invalid():
+    # tuples must be (name, value)
+    with raises(AssertionError):
+        labels(("label1", "value1", True))
@@ -17,13 +17,28 @@ class System2(System1):
     templates = [Template2]
 
 
+class Theme1(BaseThemeNote):
+    pass
+
+
+class RootSystem1(BaseRootSystemNote):
+    themes = [Theme1]
+    templates = [Template1]
+
+
 def test_system(session: Session, note: Note):
     system = note.transmute(BaseRootSystemNote)
     session.flush()
 
-    assert len(system.children) == 7
+    # empty categories are skipped, so only the built-in system note remains
+    assert len(system.children) == 1
     assert system.children[0].title == "TriliumAlchemySystemNote"
 
+    # built-in system note only has stylesheets
+    builtin_system = system.children[0]
+    assert len(builtin_system.children) == 1
+    assert builtin_system.children[0].title == "Stylesheets"
+
 
 def test_system_append(session: Session, note: Note):
     """
@@ -32,7 +47,7 @@ def test_system_append(session: Session, note: Note):
     system = note.transmute(System2)
     session.flush()
 
-    assert len(system.children) == 5
+    assert len(system.children) == 1
     templates = system.children[0]
 
     assert templates.title == "Templates"
@@ -41,3 +56,17 @@ def test_system_append(session: Session, note: Note):
 
     assert template1.title == "Template1"
     assert template2.title == "Template2"
+
+
+def test_root_system_order(session: Session, note: Note):
+    """
+    Verify that themes are placed right after the built-in system note.
+    """
+    system = note.transmute(RootSystem1)
+    session.flush()
+
+    assert [child.title for child in system.children] == [
+        "TriliumAlchemySystemNote",
+        "Themes",
+        "Templates",
+    ]
@@ -70,9 +70,11 @@ class Cache:
         # validate newly added entities
         self._validate(dirty_set - dirty_set_old)
 
-        logging.debug(
-            f"Flushing {len(dirty_set)} entities: (create/update/delete) {self._summary(dirty_set)}"
-        )
+        # summary iterates all entities, so only build it if it will be logged
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(
+                f"Flushing {len(dirty_set)} entities: (create/update/delete) {self._summary(dirty_set)}"
+            )
 
         # create topological sorter
         sorter = graphlib.TopologicalSorter()
@@ -132,9 +134,10 @@ class Cache:
             assert entity is self.entity_map[entity._entity_id]
         else:
             self.entity_map[entity._entity_id] = entity
-            logging.debug(
-                f"Added to cache: entity_id={entity._entity_id}, type={type(entity)}"
-            )
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(
+                    f"Added to cache: entity_id={entity._entity_id}, type={type(entity)}"
+                )
 
     def _validate(self, entity_set: set[BaseEntity]):
         """
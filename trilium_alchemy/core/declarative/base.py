@@ -161,7 +161,7 @@ class BaseDeclarativeMixin(
         note_type: str | None = None,
         mime: str | None = None,
         parents: Iterable[Note | Branch] | Note | Branch | None = None,
-        children: Iterable[Note | Branch] | None = None,
+        children: Iterable[Note | Branch | type[Note]] | None = None,
         attributes: Iterable[BaseAttribute] | None = None,
         content: str | bytes | IO | None = None,
         template: Note | type[Note] | None = None,
@@ -184,6 +184,7 @@ class BaseDeclarativeMixin(
         initializers.
 
         :param child_cls: Class of child to instantiate
+        :param children: Children of child note; any {obj}`Note` subclasses are instantiated in this note's session before the child note is constructed
         """
         child_decl_id: tuple[str, str | None] | None = child_cls._get_decl_id(
             self._note
@@ -195,6 +196,22 @@ class BaseDeclarativeMixin(
         if child_decl_id is not None:
             child_note_id, child_note_id_seed_final = child_decl_id
 
+        child_children: list[Note | Branch] | None = None
+
+        if children is not None:
+            # instantiate any classes up front, before the child is
+            # constructed
+            child_children = []
+
+            for c in children:
+                if isinstance(c, (Note, Branch)):
+                    child_children.append(c)
+                else:
+                    assert isinstance(c, type) and issubclass(
+                        c, Note
+                    ), f"Got unexpected child: {c} {type(c)}"
+                    child_children.append(c(session=self._session))
+
         child: Note = child_cls(
             note_id=child_note_id,
             session=self._session,
@@ -202,7 +219,7 @@ class BaseDeclarativeMixin(
             note_type=note_type,
             mime=mime,
             parents=parents,
-            children=children,
+            children=child_children,
             attributes=attributes,
             content=content,
             template=template,
@@ -308,13 +325,14 @@ class BaseDeclarativeMixin(
         # - add init()-based attributes/children
         # a nice side effect of this is the user doesn't have to invoke
         # super().init()
-        for cls in type(self).mro():
+        for cls in type(self).__mro__:
             if issubclass(cls, BaseDeclarativeMixin):
                 # invoke init chain added by decorators
                 cls._init_decl(self, cls, attributes, children)
 
-                # invoke manually implemented init()
-                if not is_inherited(cls, "init"):
+                # invoke manually implemented init(), if defined on this
+                # class rather than inherited
+                if "init" in cls.__dict__:
                     cls.init(
                         self,
                         attributes,
@@ -465,6 +483,29 @@ class BaseDeclarativeNote(Note, BaseDeclarativeMixin):
     Whether to take the title as the stem of the filename.
     """
 
+    _content_file_stem: str | None = None
+    """
+    Stem of {obj}`BaseDeclarativeNote.content_file`, derived once per class.
+    """
+
+    _decl_id: tuple[str, str | None] | None
+    """
+    Cached result of `_get_decl_id()` without a parent, set on first use.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Derive the stem of the content file once per class rather than upon
+        every instantiation.
+        """
+        super().__init_subclass__(**kwargs)
+
+        cls._content_file_stem = (
+            None
+            if cls.content_file is None
+            else os.path.basename(cls.content_file).split(".")[0]
+        )
+
     @property
     def note_id_seed_final(self) -> str | None:
         """
@@ -535,9 +576,7 @@ class BaseDeclarativeNote(Note, BaseDeclarativeMixin):
             )
 
             if self._stem_title:
-                container.title = os.path.basename(self.content_file).split(
-                    "."
-                )[0]
+                container.title = self._content_file_stem
 
         container.title = container.title or self.title_ or type(self).__name__
 
@@ -570,6 +609,19 @@ class BaseDeclarativeNote(Note, BaseDeclarativeMixin):
         note_id and will get the same one every time it's instantiated.
         """
 
+        if parent is None:
+            # only depends on class attributes, so derive it once per class;
+            # templates hit this several times per new_instance()
+            if "_decl_id" not in cls.__dict__:
+                cls._decl_id = cls._derive_decl_id(None)
+            return cls._decl_id
+
+        return cls._derive_decl_id(parent)
+
+    @classmethod
+    def _derive_decl_id(
+        cls, parent: BaseDeclarativeNote | None
+    ) -> tuple[str, str | None] | None:
         module: ModuleType | None = inspect.getmodule(cls)
         assert module is not None
 
@@ -624,7 +676,10 @@ class BaseDeclarativeNote(Note, BaseDeclarativeMixin):
     # Return class which specified content_file
     def _get_content_cls(self):
         for cls in type(self).mro():
-            if issubclass(cls, BaseDeclarativeNote) and cls.content_file:
+            if (
+                issubclass(cls, BaseDeclarativeNote)
+                and cls.content_file is not None
+            ):
                 return cls
 
     # Return handle of file specified by content_file
@@ -674,15 +729,3 @@ class BaseDeclarativeNote(Note, BaseDeclarativeMixin):
 
         mode = "r" if is_string(note_type, mime) else "rb"
         return open(content_path, mode)
-
-
-def is_inherited(cls: type[BaseDeclarativeMixin], attr: str) -> bool:
-    """
-    Check if given attribute is inherited from superclass (True) or defined on this
-    class (False).
-    """
-    value = getattr(cls, attr)
-    return any(
-        value is getattr(cls_super, attr, object())
-        for cls_super in cls.__bases__
-    )
@@ -14,6 +14,7 @@ from .base import BaseDeclarativeMixin, BaseDeclarativeNote
 
 __all__ = [
     "label",
+    "labels",
     "relation",
     "label_def",
     "relation_def",
@@ -22,6 +23,16 @@ __all__ = [
 ]
 
 
+def _skip_name(
+    name: str, attributes: list[BaseAttribute], accumulate: bool
+) -> bool:
+    """
+    Return whether an attribute with this name should be skipped, i.e.
+    one already exists and accumulate is False.
+    """
+    return accumulate is False and any(name == a.name for a in attributes)
+
+
 def check_name(name: str, accumulate=False):
     """
     Check if attribute with this name already exists, and bail out if so
@@ -35,7 +46,7 @@ def check_name(name: str, accumulate=False):
             attributes: list[BaseAttribute],
             children: list[Branch],
         ):
-            if accumulate is False and any(name == a.name for a in attributes):
+            if _skip_name(name, attributes, accumulate):
                 return
             return func(self, attributes, children)
 
@@ -87,6 +98,65 @@ def label(
     return _patch_init_decl(init, doc=f"- `#{label_doc}`")
 
 
+def labels(
+    *specs: str | tuple[str, str],
+    inheritable: bool = False,
+    accumulate: bool = False,
+):
+    """
+    Adds multiple {obj}`Label`s to a {obj}`BaseDeclarativeNote` or
+    {obj}`BaseDeclarativeMixin` subclass using a single decorator.
+    Each label is given as a name or a tuple of `(name, value)`.
+
+    Equivalent to stacking {obj}`label` decorators in the same order, but
+    only patches the class's declarative init once.
+
+    Example:
+
+    ```
+    @labels("sorted", ("iconClass", "bx bx-folder"))
+    class MyNote(BaseDeclarativeNote): pass
+    ```
+
+    :param specs: Label names or tuples of `(name, value)`
+    :param inheritable: Whether labels should be inherited to children
+    :param accumulate: Whether each label should be added if an attribute with its name already exists from a subclassed {obj}`BaseDeclarativeNote` or {obj}`BaseDeclarativeMixin`
+    """
+
+    label_specs: list[tuple[str, str]] = []
+
+    for spec in specs:
+        if isinstance(spec, str):
+            label_specs.append((spec, ""))
+        else:
+            assert (
+                isinstance(spec, tuple) and len(spec) == 2
+            ), f"Label must be a name or a tuple of (name, value), got: {spec}"
+            label_specs.append(spec)
+
+    def init(
+        self: BaseDeclarativeNote,
+        attributes: list[BaseAttribute],
+        _: list[Branch],
+    ):
+        for name, value in label_specs:
+            if _skip_name(name, attributes, accumulate):
+                continue
+
+            attributes.append(
+                self.create_declarative_label(
+                    name, value=value, inheritable=inheritable
+                )
+            )
+
+    doc = "\n".join(
+        f"- `#{name}`" if value == "" else f"- `#{name}={value}`"
+        for name, value in label_specs
+    )
+
+    return _patch_init_decl(init, doc=doc)
+
+
 def relation(
     name: str,
     target_cls: type[BaseDeclarativeNote],
@@ -303,7 +303,10 @@ class BaseEntity[ModelT: BaseEntityModel](
         Commit changes to Trilium database for this object.
         """
 
-        logging.debug(f"Flushing: {self.str_summary}")
+        # summary includes the model's repr, so only build it if it will
+        # be logged
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(f"Flushing: {self.str_summary}")
 
         model_new: BaseModel | None = None
         gen: Generator | None = None
@@ -225,9 +225,10 @@ class Content(NoteStatefulExtension):
 
         headers = self._note._session._etapi_headers.copy()
 
-        logging.debug(
-            f"Flushing content for {self._note}, is_string={self._is_string}"
-        )
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(
+                f"Flushing content for {self._note}, is_string={self._is_string}"
+            )
 
         if self._is_string:
             assert isinstance(blob, str)
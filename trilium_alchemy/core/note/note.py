@@ -61,6 +61,11 @@ STRING_MIME_TYPES = {
 Keep in sync with STRING_MIME_TYPES (src/services/utils.js).
 """
 
+_ZIP_CHUNK_SIZE = 1 << 20
+"""
+Chunk size in bytes used when streaming an exported zip to file.
+"""
+
 
 def is_string(note_type: str, mime: str) -> bool:
     """
@@ -655,25 +660,30 @@ class Note(BaseEntity[NoteModel]):
 
         copy_context = CopyContext()
 
-        def find_child(child: Note, dest: Note) -> Note | None:
-            """
-            Find child by title.
-            """
+        # first, populate copy context with all matched notes; walk the
+        # subtree with an explicit stack so deep templates can't hit the
+        # recursion limit, pushing in reverse to keep depth-first order
+        stack: list[tuple[Note, Note]] = [(template, self)]
+
+        while len(stack):
+            src, dest = stack.pop()
+
+            # map destination children by title once rather than scanning
+            # them for each source child; first child with a title wins
+            dest_children: dict[str, Note] = {}
             for dest_child in dest.children:
-                if child.title == dest_child.title:
-                    return dest_child
-            return None
+                dest_children.setdefault(dest_child.title, dest_child)
+
+            matched: list[tuple[Note, Note]] = []
 
-        def recurse(src: Note, dest: Note):
             for src_child in src.children:
-                dest_child = find_child(src_child, dest)
+                dest_child = dest_children.get(src_child.title)
 
                 if dest_child is not None:
                     copy_context.add_mapping(src_child, dest_child)
-                    recurse(src_child, dest_child)
+                    matched.append((src_child, dest_child))
 
-        # first, recursively populate copy context with all matched notes
-        recurse(template, self)
+            stack += reversed(matched)
 
         self._sync_subtree(template, copy_context)
 
@@ -716,18 +726,15 @@ class Note(BaseEntity[NoteModel]):
 
         url = f"{self.session._base_path}/notes/{self.note_id}/export"
         params = {"format": export_format}
-        response = requests.get(
+        # stream response to file rather than buffering the whole zip
+        with requests.get(
             url, headers=self.session._etapi_headers, params=params, stream=True
-        )
-
-        assert response.status_code == 200
+        ) as response:
+            assert response.status_code == 200
 
-        zip_file: bytes = response.content
-        assert isinstance(zip_file, bytes)
-
-        with dest_path.open("wb") as fh:
-            for chunk in response.iter_content(chunk_size=8192):
-                fh.write(chunk)
+            with dest_path.open("wb") as fh:
+                for chunk in response.iter_content(chunk_size=_ZIP_CHUNK_SIZE):
+                    fh.write(chunk)
 
     def import_zip(
         self,
@@ -749,18 +756,15 @@ class Note(BaseEntity[NoteModel]):
             self.note_id is not None
         ), f"Destination note {self.str_short} must have a note_id for import"
 
-        zip_file: bytes
-
-        # read input zip
-        with src_path.open("rb") as fh:
-            zip_file = fh.read()
-
         headers = self._session._etapi_headers.copy()
         headers["Content-Type"] = "application/octet-stream"
         headers["Content-Transfer-Encoding"] = "binary"
 
         url = f"{self.session._base_path}/notes/{self.note_id}/import"
-        response = requests.post(url, headers=headers, data=zip_file)
+
+        # stream input zip from file rather than reading it into memory
+        with src_path.open("rb") as fh:
+            response = requests.post(url, headers=headers, data=fh)
 
         assert response.status_code == 201
 
@@ -9,6 +9,7 @@ import json
 import logging
 from collections.abc import Iterable
 from enum import Enum, auto
+from functools import cached_property
 from typing import TYPE_CHECKING, Callable, Literal, cast
 
 import requests
@@ -87,12 +88,6 @@ class Session:
     Common ETAPI HTTP headers for manual requests.
     """
 
-    _root_position_base_val: int | None = None
-    """
-    Base position of root tree (just the position of root__hidden branch).
-    Access using Session._root_position_base.
-    """
-
     _logout_pending: bool = False
     """
     Indicates if this session was created using a password rather than API
@@ -518,7 +513,7 @@ class Session:
         """
         return f"{self.host}/etapi"
 
-    @property
+    @cached_property
     def _root_position_base(self) -> int:
         """
         Return the position of root__hidden branch, used as the base for
@@ -527,21 +522,15 @@ class Session:
         when a note range is selected.
 
         It should be 999999999, but best to get it dynamically and cache it.
-
-        TODO: just use functools.lru_cache
         """
 
-        # lookup base position if not set
-        if self._root_position_base_val is None:
-            # could instantiate Branch to get its position, but use etapi
-            # directly to avoid tampering with cache
-            model: EtapiBranchModel = self.api.get_branch_by_id("root__hidden")
-            assert model is not None
-
-            self._root_position_base_val = model.note_position
-            assert isinstance(self._root_position_base_val, int)
+        # could instantiate Branch to get its position, but use etapi
+        # directly to avoid tampering with cache
+        model: EtapiBranchModel = self.api.get_branch_by_id("root__hidden")
+        assert model is not None
+        assert isinstance(model.note_position, int)
 
-        return self._root_position_base_val
+        return model.note_position
 
     @property
     def _is_default(self) -> bool:
@@ -17,10 +17,10 @@ For a complete example of a note hierarchy using these classes, see
 """
 from __future__ import annotations
 
-from typing import cast
+from collections.abc import Sequence
 
-from ..core import BaseAttribute, Branch, Note, label
-from ..core.declarative.base import BaseDeclarativeNote, is_inherited
+from ..core import BaseAttribute, Branch, label, labels
+from ..core.declarative.base import BaseDeclarativeNote
 from .extension_types import (
     BaseAppCssNote,
     BaseBackendScriptNote,
@@ -98,105 +98,150 @@ class Scripts(BaseHiddenCategoryNote):
 # TODO: long term: automatically create System and populate by
 # checking bases of classes in module
 # - e.g. add all notes inheriting from BaseTemplateNote to "Templates" note
-@label("iconClass", "bx bx-bracket")
-@label("archived")
+@labels(("iconClass", "bx bx-bracket"), "archived")
 class BaseSystemNote(BaseDeclarativeNote):
     """
     Base class for a "system" note, a collection of various types of
     infrastructure notes.
 
     Attributes such as {obj}`BaseSystemNote.templates` from any base classes
-    are appended.
+    are appended. A category note (e.g. `Templates`) is only added if it
+    would have any children. Lists are converted to tuples when the
+    subclass is created.
+
+    These attributes are collected once when the subclass is created, so
+    they must be declared in the class body; assigning them afterwards
+    (e.g. `MySystem.templates = (MyTemplate,)`{l=python}) has no effect.
     """
 
-    templates: list[type[BaseTemplateNote]] | None = None
+    templates: Sequence[type[BaseTemplateNote]] | None = None
     """
-    List of {obj}`Template` subclasses.
+    Tuple or list of {obj}`BaseTemplateNote` subclasses.
     """
 
-    workspace_templates: list[type[BaseWorkspaceTemplateNote]] | None = None
+    workspace_templates: Sequence[type[BaseWorkspaceTemplateNote]] | None = None
     """
-    List of {obj}`BaseWorkspaceTemplateNote` subclasses.
+    Tuple or list of {obj}`BaseWorkspaceTemplateNote` subclasses.
     """
 
-    stylesheets: list[type[BaseAppCssNote]] | None = None
+    stylesheets: Sequence[type[BaseAppCssNote]] | None = None
     """
-    List of {obj}`AppCss` subclasses.
+    Tuple or list of {obj}`BaseAppCssNote` subclasses.
     """
 
-    widgets: list[type[BaseWidgetNote]] | None = None
+    widgets: Sequence[type[BaseWidgetNote]] | None = None
     """
-    List of {obj}`Widget` subclasses.
+    Tuple or list of {obj}`BaseWidgetNote` subclasses.
     """
 
-    scripts: list[
+    scripts: Sequence[
         type[BaseFrontendScriptNote | BaseBackendScriptNote]
     ] | None = None
     """
-    List of {obj}`FrontendScript` or {obj}`BackendScript` subclasses.
+    Tuple or list of {obj}`BaseFrontendScriptNote` or
+    {obj}`BaseBackendScriptNote` subclasses.
+    """
+
+    _categories: tuple[tuple[type[BaseDeclarativeNote], str], ...] = (
+        (Templates, "templates"),
+        (WorkspaceTemplates, "workspace_templates"),
+        (Stylesheets, "stylesheets"),
+        (Widgets, "widgets"),
+        (Scripts, "scripts"),
+    )
+    """
+    Category note classes and the names of attributes holding note classes
+    to collect under them, in order of creation.
+    """
+
+    _collected_notes: dict[str, tuple[type[BaseDeclarativeNote], ...]] = {}
+    """
+    Mapping of attribute name to note classes collected from this class
+    and its bases, populated when subclassed.
     """
 
+    def __init_subclass__(cls, **kwargs):
+        """
+        Collect note classes once per class rather than upon every
+        instantiation.
+        """
+        super().__init_subclass__(**kwargs)
+
+        # validate attributes declared on this class itself; those of
+        # base classes were validated when they were created
+        for _, attr in cls._categories:
+            attr_list = cls.__dict__.get(attr)
+
+            if attr_list is None:
+                continue
+
+            assert isinstance(attr_list, (list, tuple))
+            for note_cls in attr_list:
+                assert issubclass(
+                    note_cls, BaseDeclarativeNote
+                ), f"Got unexpected class in note attribute '{attr}': {note_cls} {type(note_cls)}"
+
+            # store as tuple since it's not mutated after declaration
+            if isinstance(attr_list, list):
+                setattr(cls, attr, tuple(attr_list))
+
+        cls._collected_notes = {
+            attr: cls._collect_classes(attr) for _, attr in cls._categories
+        }
+
     def init(self, _: list[BaseAttribute], children: list[Branch]):
-        children.append(
-            self.create_declarative_child(
-                Templates, children=self._collect_notes("templates")
-            )
-        )
-        children.append(
-            self.create_declarative_child(
-                WorkspaceTemplates,
-                children=self._collect_notes("workspace_templates"),
-            )
-        )
-        children.append(
-            self.create_declarative_child(
-                Stylesheets, children=self._collect_notes("stylesheets")
-            )
-        )
-        children.append(
-            self.create_declarative_child(
-                Widgets, children=self._collect_notes("widgets")
-            )
-        )
-        children.append(
-            self.create_declarative_child(
-                Scripts, children=self._collect_notes("scripts")
-            )
-        )
-
-    def _collect_notes(self, attr: str) -> list[Note]:
+        # bind methods once rather than per category
+        create = self.create_declarative_child
+        collect = self._collect_notes
+        children_append = children.append
+
+        for category_cls, attr in self._categories:
+            note_classes = collect(attr)
+
+            # skip categories which would be empty; pass classes rather than
+            # instances, they're instantiated by create_declarative_child()
+            # when building the category's children
+            if len(note_classes):
+                children_append(create(category_cls, children=note_classes))
+
+    def _collect_notes(
+        self, attr: str
+    ) -> tuple[type[BaseDeclarativeNote], ...]:
         """
         Get the attribute with the given name, appending those of
         base classes.
-        """
 
-        notes: list[Note] = []
+        Returns note classes rather than instances; they're instantiated by
+        {obj}`BaseDeclarativeMixin.create_declarative_child` when building
+        the category note's children.
+        """
+        return type(self)._collected_notes.get(attr, ())
 
-        for cls in type(self).mro():
-            if issubclass(cls, BaseSystemNote):
-                # skip if it doesn't have this attribute
-                if not hasattr(cls, attr):
-                    continue
+    @classmethod
+    def _collect_classes(
+        cls, attr: str
+    ) -> tuple[type[BaseDeclarativeNote], ...]:
+        """
+        Collect note classes for the given attribute, appending those of
+        base classes.
+        """
 
-                # skip if the attribute belongs to a subclass
-                if is_inherited(cls, attr):
-                    continue
+        note_classes: list[type[BaseDeclarativeNote]] = []
 
-                attr_list = cast(list[Note] | None, getattr(cls, attr))
+        for cls_mro in cls.__mro__:
+            # only take the attribute if it's defined on this class
+            # itself rather than inherited from a base class
+            attr_list = cls_mro.__dict__.get(attr)
 
-                if attr_list is not None:
-                    # validate
-                    assert isinstance(attr_list, list)
-                    for note_cls in attr_list:
-                        assert issubclass(
-                            note_cls, BaseDeclarativeNote
-                        ), f"Got unexpected class in note attribute '{attr}': {note_cls} {type(note_cls)}"
+            if attr_list is None:
+                continue
 
-                        notes.append(note_cls(session=self.session))
+            if not issubclass(cls_mro, BaseSystemNote):
+                continue
 
-                    # notes += attr_list
+            note_classes += attr_list
 
-        return notes
+        return tuple(note_classes)
 
 
 class TriliumAlchemyStylesheetNote(BaseAppCssNote):
@@ -214,7 +259,7 @@ class TriliumAlchemySystemNote(BaseSystemNote):
     Built-in `System` note to insert custom stylesheet.
     """
 
-    stylesheets = [TriliumAlchemyStylesheetNote]
+    stylesheets = (TriliumAlchemyStylesheetNote,)
 
 
 class BaseRootSystemNote(BaseSystemNote):
@@ -222,22 +267,19 @@ class BaseRootSystemNote(BaseSystemNote):
     Base class for a root "system" note, additionally containing themes.
     """
 
-    themes: list[type[BaseThemeNote]] | None = None
+    themes: Sequence[type[BaseThemeNote]] | None = None
     """
-    List of {obj}`Theme` subclasses
+    Tuple or list of {obj}`BaseThemeNote` subclasses.
     """
 
+    # init() below runs before BaseSystemNote.init(), so listing themes
+    # first places them right after the built-in system note
+    _categories = ((Themes, "themes"),) + BaseSystemNote._categories
+
     def init(self, _: list[BaseAttribute], children: list[Branch]):
         # add built-in system note
         children.append(self.create_declarative_child(TriliumAlchemySystemNote))
 
-        # add themes
-        children.append(
-            self.create_declarative_child(
-                Themes, children=self._collect_notes("themes")
-            )
-        )
-
 
 class BaseRootNote(BaseDeclarativeNote):
     """